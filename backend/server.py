@@ -1,19 +1,27 @@
-from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, status, Request
+from fastapi import FastAPI, HTTPException, Depends, UploadFile, File, status, Query, BackgroundTasks, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import FileResponse, HTMLResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel, EmailStr, Field
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 import jwt
 import bcrypt
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError
 import os
 import uuid
-import json
+import orjson
+import hashlib
+import time
+import threading
 from dotenv import load_dotenv
+from cachetools import TTLCache
+import aiofiles
 import asyncio
 from pathlib import Path
 
@@ -24,15 +32,12 @@ load_dotenv()
 BASE_DIR = Path(__file__).parent.parent
 FRONTEND_BUILD_DIR = BASE_DIR / "frontend" / "build"
 
-app = FastAPI(title="AI-Powered FRA Atlas & DSS API", docs_url="/api/docs", redoc_url="/api/redoc")
-
-# Serve static files from the React build directory
-if FRONTEND_BUILD_DIR.exists():
-    app.mount("/static", StaticFiles(directory=str(FRONTEND_BUILD_DIR / "static")), name="static")
-    templates = Jinja2Templates(directory=str(FRONTEND_BUILD_DIR))
-else:
-    print("Warning: Frontend build directory not found. Run 'npm run build' in the frontend directory.")
-    templates = None
+app = FastAPI(
+    title="AI-Powered FRA Atlas & DSS API",
+    docs_url="/api/docs",
+    redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse
+)
 
 # CORS configuration
 app.add_middleware(
@@ -50,8 +55,18 @@ security = HTTPBearer()
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
 DB_NAME = os.getenv("DB_NAME", "fra_atlas_db")
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "fra_atlas_secret_key_2024")
+
+# Hoisted so PyJWT doesn't re-encode the secret or rebuild options per call;
+# auth runs on every request
+_JWT_SECRET_BYTES = JWT_SECRET_KEY.encode('utf-8')
+_JWT_ALGORITHM = "HS256"
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+_JWT_DECODE_OPTIONS = {"verify_aud": False}
 EMERGENT_LLM_KEY = os.getenv("EMERGENT_LLM_KEY")
 
+# Uploads are streamed to disk in chunks of this size (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 # MongoDB client
 client = AsyncIOMotorClient(MONGO_URL)
 db = client[DB_NAME]
@@ -97,51 +112,131 @@ class ClaimUpdate(BaseModel):
     status: str
     officer_notes: Optional[str] = None
 
+class ClaimSummary(BaseModel):
+    """List-view claim shape without the heavy ai_analysis/documents fields"""
+    id: str = Field(alias="_id")
+    user_id: Optional[str] = None
+    title: str
+    description: str
+    location: Dict[str, Any]
+    status: str = "pending"
+    created_at: datetime
+    updated_at: datetime
+    area_hectares: Optional[float] = None
+    forest_type: Optional[str] = None
+    community_details: Optional[str] = None
+
+class ClaimDetail(ClaimSummary):
+    """Full claim shape including documents, AI analysis and review fields"""
+    documents: List[str] = []
+    ai_analysis: Optional[str] = None
+    officer_notes: Optional[str] = None
+    reviewed_by: Optional[str] = None
+
 # Helper functions
+
+# Argon2id tuned for interactive logins per OWASP recommendations; noticeably
+# cheaper wall-time than bcrypt at equivalent security. Legacy bcrypt hashes
+# ($2b$...) still verify and are rehashed on login.
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19 * 1024, parallelism=1)
+
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return _password_hasher.hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    if hashed.startswith("$2"):
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    try:
+        return _password_hasher.verify(hashed, password)
+    except VerificationError:
+        return False
 
 def create_jwt_token(user_data: dict) -> str:
     payload = {
         "user_id": user_data.get("_id") or user_data.get("id"),
         "email": user_data["email"],
         "role": user_data["role"],
-        "exp": datetime.utcnow() + timedelta(hours=24)
+        # Epoch int avoids two datetime constructions per token; PyJWT
+        # accepts it directly
+        "exp": int(time.time()) + 24 * 3600
     }
-    return jwt.encode(payload, JWT_SECRET_KEY, algorithm="HS256")
+    return jwt.encode(payload, _JWT_SECRET_BYTES, algorithm=_JWT_ALGORITHM)
+
+# Cache of verified JWT payloads keyed by token hash, so repeat requests with
+# the same token skip the HMAC signature check. Short TTL keeps revocation
+# semantics close to uncached behavior; expired tokens are never served.
+_jwt_cache = TTLCache(maxsize=10000, ttl=10)
+_jwt_cache_lock = threading.Lock()
 
 def verify_jwt_token(token: str) -> dict:
+    cache_key = hashlib.sha256(token.encode('utf-8')).hexdigest()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(cache_key)
+    if payload is not None:
+        if payload.get("exp", 0) > time.time():
+            return payload
+        raise HTTPException(status_code=401, detail="Token expired")
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=["HS256"])
-        return payload
+        payload = jwt.decode(token, _JWT_SECRET_BYTES, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    # Only successfully verified payloads are cached
+    with _jwt_cache_lock:
+        _jwt_cache[cache_key] = payload
+    return payload
+
+# Cache of user documents keyed by user id, so authenticated requests skip
+# the per-request Mongo round-trip. Write paths must invalidate via
+# _user_cache.pop(user_id, None).
+_user_cache = TTLCache(maxsize=5000, ttl=60)
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     token = credentials.credentials
     payload = verify_jwt_token(token)
-    user = await db.users.find_one({"_id": payload["user_id"]})
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-    return user
+    user_id = payload["user_id"]
+    user = _user_cache.get(user_id)
+    if user is None:
+        user = await db.users.find_one({"_id": user_id})
+        if not user:
+            raise HTTPException(status_code=401, detail="User not found")
+        _user_cache[user_id] = user
+    # Hand out a copy so handlers can't mutate the cached document
+    return dict(user)
 
 # AI Integration Functions
+
+_DOC_SYSTEM_MESSAGE = "You are an AI assistant specialized in analyzing FRA (Forest Rights Act) claim documents. Extract key information and provide insights."
+_INSIGHTS_SYSTEM_MESSAGE = "You are an AI assistant specialized in analyzing FRA claims data and providing policy insights."
+
+# Each call gets its own session: the SDK keeps per-session conversation
+# history, so a shared session would re-send ever-growing history on every
+# request and leak earlier users' documents into later prompts.
+
+def _make_doc_chat():
+    from emergentintegrations.llm.chat import LlmChat
+    return LlmChat(
+        api_key=EMERGENT_LLM_KEY,
+        session_id=f"doc_analysis_{uuid.uuid4()}",
+        system_message=_DOC_SYSTEM_MESSAGE
+    ).with_model("gemini", "gemini-2.0-flash")
+
+def _make_insights_chat():
+    from emergentintegrations.llm.chat import LlmChat
+    return LlmChat(
+        api_key=EMERGENT_LLM_KEY,
+        session_id=f"dashboard_insights_{uuid.uuid4()}",
+        system_message=_INSIGHTS_SYSTEM_MESSAGE
+    ).with_model("gemini", "gemini-2.0-flash")
+
 async def analyze_document_with_ai(file_path: str, claim_data: dict) -> str:
     """Analyze uploaded documents using Gemini AI"""
     try:
-        from emergentintegrations.llm.chat import LlmChat, UserMessage, FileContentWithMimeType
-        
-        chat = LlmChat(
-            api_key=EMERGENT_LLM_KEY,
-            session_id=f"doc_analysis_{datetime.utcnow().timestamp()}",
-            system_message="You are an AI assistant specialized in analyzing FRA (Forest Rights Act) claim documents. Extract key information and provide insights."
-        ).with_model("gemini", "gemini-2.0-flash")
-        
+        from emergentintegrations.llm.chat import UserMessage, FileContentWithMimeType
+
+        chat = _make_doc_chat()
+
         # Create file content object
         document_file = FileContentWithMimeType(
             file_path=file_path,
@@ -172,32 +267,123 @@ async def analyze_document_with_ai(file_path: str, claim_data: dict) -> str:
     except Exception as e:
         return f"AI analysis failed: {str(e)}"
 
-async def generate_insights_for_dashboard(claims_data: List[dict]) -> dict:
-    """Generate AI insights for the dashboard"""
+class DocumentAnalysisBatcher:
+    """Coalesces concurrent document analyses into one multi-file Gemini call.
+
+    Requests arriving within a short window share a single LLM round trip
+    (DataLoader-style); results are fanned back out to callers via futures.
+    A lone request in the window falls through to the single-document path.
+    """
+
+    def __init__(self, max_batch: int = 8, window: float = 0.05):
+        self.max_batch = max_batch
+        self.window = window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, file_path: str, claim_data: dict) -> str:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+        future = loop.create_future()
+        await self._queue.put((file_path, claim_data, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            if len(batch) == 1:
+                file_path, claim_data, future = batch[0]
+                result = await analyze_document_with_ai(file_path, claim_data)
+                if not future.done():
+                    future.set_result(result)
+                continue
+
+            results = await self._analyze_batch(batch)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _analyze_batch(self, batch) -> List[str]:
+        try:
+            from emergentintegrations.llm.chat import UserMessage, FileContentWithMimeType
+
+            chat = _make_doc_chat()
+
+            document_files = []
+            contexts = []
+            for i, (file_path, claim_data, _) in enumerate(batch, start=1):
+                document_files.append(FileContentWithMimeType(
+                    file_path=file_path,
+                    mime_type="application/pdf" if file_path.endswith('.pdf') else "image/jpeg"
+                ))
+                contexts.append(
+                    f"Document {i}: claim for {claim_data.get('title', 'Forest Rights')} "
+                    f"in {claim_data.get('location', {}).get('address', 'Unknown location')}"
+                )
+
+            analysis_prompt = f"""
+            Analyze each of the attached FRA claim documents and extract for each:
+            1. Claimant details (name, address, community)
+            2. Land details (area, location, forest type)
+            3. Evidence of traditional occupation
+            4. Document authenticity indicators
+            5. Any missing information or red flags
+
+            Context for the documents, in order:
+            {chr(10).join(contexts)}
+
+            For each document, start its analysis with a line "### DOCUMENT <number>"
+            and provide a structured analysis in JSON format.
+            """
+
+            user_message = UserMessage(
+                text=analysis_prompt,
+                file_contents=document_files
+            )
+
+            response = await chat.send_message(user_message)
+
+            # Split the combined response back into per-document analyses; if
+            # the model ignored the markers, every caller gets the full text
+            parts = response.split("### DOCUMENT")
+            if len(parts) - 1 == len(batch):
+                return ["### DOCUMENT" + part.rstrip() for part in parts[1:]]
+            return [response] * len(batch)
+
+        except Exception as e:
+            return [f"AI analysis failed: {str(e)}"] * len(batch)
+
+_document_batcher = DocumentAnalysisBatcher()
+
+async def generate_insights_for_dashboard(stats: dict, sample: List[dict]) -> dict:
+    """Generate AI insights for the dashboard from aggregated stats and a
+    fixed-size sample of recent claims"""
     try:
-        from emergentintegrations.llm.chat import LlmChat, UserMessage
-        
-        chat = LlmChat(
-            api_key=EMERGENT_LLM_KEY,
-            session_id=f"dashboard_insights_{datetime.utcnow().timestamp()}",
-            system_message="You are an AI assistant specialized in analyzing FRA claims data and providing policy insights."
-        ).with_model("gemini", "gemini-2.0-flash")
-        
-        # Prepare data summary
-        total_claims = len(claims_data)
-        approved = len([c for c in claims_data if c.get('status') == 'approved'])
-        pending = len([c for c in claims_data if c.get('status') == 'pending'])
-        rejected = len([c for c in claims_data if c.get('status') == 'rejected'])
-        
+        from emergentintegrations.llm.chat import UserMessage
+
+        chat = _make_insights_chat()
+
         prompt = f"""
         Analyze the following FRA claims statistics and provide insights:
-        
-        Total Claims: {total_claims}
-        Approved: {approved}
-        Pending: {pending}
-        Rejected: {rejected}
-        
-        Sample claims data: {json.dumps(claims_data[:5], default=str)}
+
+        Total Claims: {stats.get('total', 0)}
+        Approved: {stats.get('approved', 0)}
+        Pending: {stats.get('pending', 0)}
+        Rejected: {stats.get('rejected', 0)}
+
+        Sample claims data: {orjson.dumps(sample, default=str).decode()}
         
         Provide insights on:
         1. Approval patterns and trends
@@ -223,6 +409,18 @@ async def generate_insights_for_dashboard(claims_data: List[dict]) -> dict:
             "generated_at": datetime.utcnow().isoformat()
         }
 
+@app.on_event("startup")
+async def create_indexes():
+    # Indexes for the hot query keys: login by email, per-user claim lists,
+    # dashboard status counts, reports grouped by state. Cursor pagination
+    # rides on the built-in _id index.
+    await db.users.create_index("email", unique=True)
+    await db.claims.create_index("user_id")
+    await db.claims.create_index("status")
+    await db.claims.create_index([("location.state", 1), ("status", 1)])
+    # Newest-updated_at lookup backing the ETag computation on the hot GETs
+    await db.claims.create_index([("updated_at", -1)])
+
 # API Routes
 
 @app.get("/")
@@ -241,8 +439,8 @@ async def register_user(user_data: UserRegister):
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Hash password and create user
-    hashed_password = hash_password(user_data.password)
+    # Hash password and create user (bcrypt is CPU-bound, keep it off the event loop)
+    hashed_password = await run_in_threadpool(hash_password, user_data.password)
     user_dict = {
         "_id": str(uuid.uuid4()),
         "email": user_data.email,
@@ -255,7 +453,7 @@ async def register_user(user_data: UserRegister):
     }
     
     await db.users.insert_one(user_dict)
-    
+
     # Create JWT token
     user_dict_for_response = user_dict.copy()
     user_dict_for_response.pop("password")  # Remove password from response
@@ -266,9 +464,15 @@ async def register_user(user_data: UserRegister):
 @app.post("/api/auth/login")
 async def login_user(login_data: UserLogin):
     user = await db.users.find_one({"email": login_data.email})
-    if not user or not verify_password(login_data.password, user["password"]):
+    if not user or not await run_in_threadpool(verify_password, login_data.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
-    
+
+    # Transparently migrate legacy bcrypt hashes to Argon2 on successful login
+    if user["password"].startswith("$2"):
+        new_hash = await run_in_threadpool(hash_password, login_data.password)
+        await db.users.update_one({"_id": user["_id"]}, {"$set": {"password": new_hash}})
+        _user_cache.pop(user["_id"], None)
+
     user.pop("password")  # Remove password from response
     token = create_jwt_token(user)
     
@@ -279,29 +483,61 @@ async def get_current_user_info(current_user: dict = Depends(get_current_user)):
     current_user.pop("password", None)
     return current_user
 
+async def _claims_etag(scope: str) -> str:
+    """ETag for claims-derived responses, keyed on the newest updated_at.
+
+    One cheap indexed find_one instead of recomputing the response lets
+    repeat visits inside the cache window turn into empty 304s.
+    """
+    latest = await db.claims.find_one({}, {"updated_at": 1}, sort=[("updated_at", -1)])
+    stamp = str(latest["updated_at"]) if latest else "empty"
+    return hashlib.md5(f"{scope}:{stamp}".encode()).hexdigest()
+
+def _apply_cache_headers(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=30"
+
 # FRA Claims routes
 @app.post("/api/claims")
 async def create_claim(claim_data: FRAClaim, current_user: dict = Depends(get_current_user)):
     claim_dict = claim_data.dict()
+    now = datetime.utcnow()
     claim_dict["user_id"] = current_user["_id"]
     claim_dict["_id"] = str(uuid.uuid4())
-    claim_dict["created_at"] = datetime.utcnow()
-    claim_dict["updated_at"] = datetime.utcnow()
+    claim_dict["created_at"] = now
+    claim_dict["updated_at"] = now
     
     await db.claims.insert_one(claim_dict)
     return claim_dict
 
-@app.get("/api/claims")
-async def get_claims(current_user: dict = Depends(get_current_user)):
+@app.get("/api/claims", response_model=List[ClaimSummary])
+async def get_claims(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None
+):
+    etag = await _claims_etag(f"claims:{current_user['_id']}")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    _apply_cache_headers(response, etag)
+
     # Filter based on user role
     if current_user["role"] in ["Community User"]:
-        claims = await db.claims.find({"user_id": current_user["_id"]}).to_list(length=None)
+        query = {"user_id": current_user["_id"]}
     else:
-        claims = await db.claims.find().to_list(length=None)
-    
+        query = {}
+
+    # Cursor pagination: pass the last _id of the previous page as ?cursor=
+    if cursor:
+        query["_id"] = {"$gt": cursor}
+
+    # List view never needs the ai_analysis/documents blobs
+    claims = await db.claims.find(query, {"ai_analysis": 0, "documents": 0}).sort("_id", 1).limit(limit).to_list(length=limit)
     return claims
 
-@app.get("/api/claims/{claim_id}")
+@app.get("/api/claims/{claim_id}", response_model=ClaimDetail)
 async def get_claim(claim_id: str, current_user: dict = Depends(get_current_user)):
     claim = await db.claims.find_one({"_id": claim_id})
     if not claim:
@@ -340,9 +576,18 @@ async def update_claim_status(
     
     return {"message": "Claim status updated successfully"}
 
+async def _analyze_and_store(claim_id: str, file_path: str, claim: dict):
+    """Background task: run AI analysis and write the result back to the claim"""
+    ai_analysis = await _document_batcher.submit(file_path, claim)
+    await db.claims.update_one(
+        {"_id": claim_id},
+        {"$set": {"ai_analysis": ai_analysis, "updated_at": datetime.utcnow()}}
+    )
+
 @app.post("/api/claims/{claim_id}/upload")
 async def upload_document(
     claim_id: str,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: dict = Depends(get_current_user)
 ):
@@ -358,49 +603,79 @@ async def upload_document(
     upload_dir = Path("/app/uploads")
     upload_dir.mkdir(exist_ok=True)
     
-    # Save file
+    # Stream the upload to disk in fixed-size chunks so memory stays O(chunk)
+    # regardless of file size, without blocking the event loop
     file_path = upload_dir / f"{claim_id}_{file.filename}"
-    with open(file_path, "wb") as buffer:
-        content = await file.read()
-        buffer.write(content)
-    
-    # Run AI analysis on the document
-    ai_analysis = await analyze_document_with_ai(str(file_path), claim)
+    async with aiofiles.open(file_path, "wb") as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
     
-    # Update claim with document and AI analysis
+    # Record the document now; the multi-second AI analysis runs after the
+    # response is sent and the client polls the claim for the result
     await db.claims.update_one(
         {"_id": claim_id},
         {
             "$push": {"documents": str(file_path)},
-            "$set": {
-                "ai_analysis": ai_analysis,
-                "updated_at": datetime.utcnow()
-            }
+            "$set": {"updated_at": datetime.utcnow()}
         }
     )
-    
+    background_tasks.add_task(_analyze_and_store, claim_id, str(file_path), claim)
+
     return {
-        "message": "Document uploaded and analyzed successfully",
+        "message": "Document uploaded successfully, AI analysis in progress",
         "file_path": str(file_path),
-        "ai_analysis": ai_analysis
+        "ai_analysis": "processing"
     }
 
 # Dashboard and Analytics routes
+
+# The dashboard response embeds a multi-second LLM call but its inputs change
+# slowly, so the whole payload is memoized for 60s. Output is currently
+# role-independent; key by role here if that ever changes.
+_dashboard_cache = TTLCache(maxsize=1, ttl=60)
+
 @app.get("/api/dashboard/stats")
-async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
-    # Basic statistics
-    total_claims = await db.claims.count_documents({})
-    approved_claims = await db.claims.count_documents({"status": "approved"})
-    pending_claims = await db.claims.count_documents({"status": "pending"})
-    rejected_claims = await db.claims.count_documents({"status": "rejected"})
-    
-    # Get all claims for AI analysis
-    all_claims = await db.claims.find().to_list(length=None)
-    
-    # Generate AI insights
-    ai_insights = await generate_insights_for_dashboard(all_claims)
-    
-    return {
+async def get_dashboard_stats(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user)
+):
+    etag = await _claims_etag("dashboard")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    _apply_cache_headers(response, etag)
+
+    # The memo is only valid for the ETag it was computed under; a claim
+    # write changes the ETag and drops straight through to a recompute
+    cached = _dashboard_cache.get("stats")
+    if cached is not None and cached["etag"] == etag:
+        return cached["payload"]
+
+    # Basic statistics - one aggregation instead of four count_documents round trips
+    pipeline = [
+        {
+            "$group": {
+                "_id": None,
+                "total": {"$sum": 1},
+                "approved": {"$sum": {"$cond": [{"$eq": ["$status", "approved"]}, 1, 0]}},
+                "pending": {"$sum": {"$cond": [{"$eq": ["$status", "pending"]}, 1, 0]}},
+                "rejected": {"$sum": {"$cond": [{"$eq": ["$status", "rejected"]}, 1, 0]}}
+            }
+        }
+    ]
+    counts = await db.claims.aggregate(pipeline).to_list(length=1)
+    row = counts[0] if counts else {"total": 0, "approved": 0, "pending": 0, "rejected": 0}
+    total_claims = row["total"]
+    approved_claims = row["approved"]
+    pending_claims = row["pending"]
+    rejected_claims = row["rejected"]
+
+    # Counts come straight from the aggregation and the prompt sample is a
+    # projected five most recent claims, so the full collection never leaves Mongo
+    sample = await db.claims.find({}, {"ai_analysis": 0, "documents": 0}).sort("created_at", -1).limit(5).to_list(length=5)
+    ai_insights = await generate_insights_for_dashboard(row, sample)
+
+    stats = {
         "statistics": {
             "total_claims": total_claims,
             "approved_claims": approved_claims,
@@ -411,24 +686,35 @@ async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
         "ai_insights": ai_insights,
         "last_updated": datetime.utcnow().isoformat()
     }
+    _dashboard_cache["stats"] = {"etag": etag, "payload": stats}
+    return stats
 
 @app.get("/api/dashboard/map-data")
-async def get_map_data(current_user: dict = Depends(get_current_user)):
-    claims = await db.claims.find().to_list(length=None)
-    
-    # Format data for map visualization
-    map_data = []
-    for claim in claims:
-        if claim.get("location"):
-            map_data.append({
-                "id": claim["_id"],
-                "title": claim["title"],
-                "status": claim["status"],
-                "location": claim["location"],
-                "created_at": claim["created_at"].isoformat() if isinstance(claim["created_at"], datetime) else str(claim["created_at"])
-            })
-    
-    return map_data
+async def get_map_data(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    limit: int = Query(1000, ge=1, le=5000),
+    cursor: Optional[str] = None
+):
+    etag = await _claims_etag("map")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    _apply_cache_headers(response, etag)
+
+    match = {"location": {"$ne": None}}
+    if cursor:
+        match["_id"] = {"$gt": cursor}
+
+    # Let Mongo filter and reshape the documents so no per-claim Python work
+    # (or the documents/ai_analysis blobs) is needed on this hot path
+    pipeline = [
+        {"$match": match},
+        {"$sort": {"_id": 1}},
+        {"$limit": limit},
+        {"$project": {"_id": 0, "id": "$_id", "title": 1, "status": 1, "location": 1, "created_at": 1}}
+    ]
+    return await db.claims.aggregate(pipeline).to_list(length=limit)
 
 # Reports routes
 @app.get("/api/reports/summary")
@@ -454,31 +740,29 @@ async def get_summary_report(current_user: dict = Depends(get_current_user)):
         "data": state_summary
     }
 
-# Catch-all route for React Router
-def serve_react_app(request: Request):
-    if templates:
-        return templates.TemplateResponse("index.html", {"request": request})
-    return {"message": "Frontend not built. Run 'npm run build' in the frontend directory."}
-
-# Add catch-all route for React Router
-@app.get("/{full_path:path}", response_class=HTMLResponse)
-async def catch_all(full_path: str, request: Request):
-    # If the path starts with /api, it's an API endpoint
-    if full_path.startswith("api/"):
-        raise HTTPException(status_code=404, detail="API endpoint not found")
-    
-    # Check if the file exists in the static directory
-    static_file = FRONTEND_BUILD_DIR / full_path
-    if static_file.exists() and static_file.is_file():
-        return FileResponse(static_file)
-    
-    # If no file found, serve the React app (it will handle 404s)
-    return serve_react_app(request)
-
-# Add a root route for the React app
-@app.get("/", response_class=HTMLResponse)
-async def root(request: Request):
-    return serve_react_app(request)
+class SPAStaticFiles(StaticFiles):
+    """StaticFiles that serves index.html for unmatched client-side routes.
+
+    Starlette's html=True only maps directory URLs to index.html; direct
+    navigation to a React Router path like /dashboard would otherwise 404.
+    Unknown /api paths still 404 so API errors aren't masked by the SPA.
+    """
+
+    async def get_response(self, path: str, scope):
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            if e.status_code == 404 and not path.startswith("api/"):
+                return await super().get_response("index.html", scope)
+            raise
+
+# Serve the React build through Starlette's static fast path, falling back to
+# index.html for client-side routes. Mounted last so the /api routes above
+# always win.
+if FRONTEND_BUILD_DIR.exists():
+    app.mount("/", SPAStaticFiles(directory=str(FRONTEND_BUILD_DIR), html=True), name="spa")
+else:
+    print("Warning: Frontend build directory not found. Run 'npm run build' in the frontend directory.")
 
 if __name__ == "__main__":
     import uvicorn
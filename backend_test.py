@@ -6,6 +6,8 @@ from datetime import datetime
 class FRAAtlasAPITester:
     def __init__(self, base_url="https://fra-map-system.preview.emergentagent.com"):
         self.base_url = base_url
+        # One session for the whole run so TLS/TCP setup is paid once
+        self.session = requests.Session()
         self.token = None
         self.user_id = None
         self.tests_run = 0
@@ -25,16 +27,16 @@ class FRAAtlasAPITester:
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers)
+                response = self.session.get(url, headers=headers)
             elif method == 'POST':
                 if files:
                     # Remove Content-Type for file uploads
                     headers.pop('Content-Type', None)
-                    response = requests.post(url, files=files, headers=headers)
+                    response = self.session.post(url, files=files, headers=headers)
                 else:
-                    response = requests.post(url, json=data, headers=headers)
+                    response = self.session.post(url, json=data, headers=headers)
             elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers)
+                response = self.session.put(url, json=data, headers=headers)
 
             success = response.status_code == expected_status
             if success: